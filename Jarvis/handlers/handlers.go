@@ -3,6 +3,7 @@ package handlers
 
 import (
 	"bufio"
+	"bytes"
 	"context"
 	"encoding/json"
 	"fmt"
@@ -2164,6 +2165,30 @@ func (h *Handler) DiagnoseProfileHealth(ctx context.Context, request mcp.CallToo
 	return mcp.NewToolResultText(builder.String()), nil
 }
 
+// mcpResponsePayload returns the JSON-RPC message from a streamable HTTP response.
+// Servers may reply with plain JSON or an SSE stream; the Content-Type decides
+// once which it is, and for SSE the data lines of the first event are joined.
+func mcpResponsePayload(contentType string, body []byte) []byte {
+	if !strings.HasPrefix(strings.ToLower(strings.TrimSpace(contentType)), "text/event-stream") {
+		return body
+	}
+
+	var data [][]byte
+	for _, line := range bytes.Split(body, []byte("\n")) {
+		line = bytes.TrimRight(line, "\r")
+		if len(line) == 0 && len(data) > 0 {
+			break
+		}
+		if bytes.HasPrefix(line, []byte("data:")) {
+			data = append(data, bytes.TrimPrefix(line[len("data:"):], []byte(" ")))
+		}
+	}
+	if len(data) == 0 {
+		return body
+	}
+	return bytes.Join(data, []byte("\n"))
+}
+
 // DiagnoseTestEndpoint tests an MCP endpoint and reports tool availability
 func (h *Handler) DiagnoseTestEndpoint(ctx context.Context, request mcp.CallToolRequest) (*mcp.CallToolResult, error) {
 	args, _ := request.Params.Arguments.(map[string]interface{})
@@ -2222,6 +2247,7 @@ func (h *Handler) DiagnoseTestEndpoint(ctx context.Context, request mcp.CallTool
 	}
 
 	body, _ := io.ReadAll(resp2.Body)
+	body = mcpResponsePayload(resp2.Header.Get("Content-Type"), body)
 	bodyStr := string(body)
 
 	type initResult struct {
@@ -2265,6 +2291,7 @@ func (h *Handler) DiagnoseTestEndpoint(ctx context.Context, request mcp.CallTool
 		} else {
 			defer resp3.Body.Close()
 			body3, _ := io.ReadAll(resp3.Body)
+			body3 = mcpResponsePayload(resp3.Header.Get("Content-Type"), body3)
 			bodyStr3 := string(body3)
 
 			type toolsResult struct {
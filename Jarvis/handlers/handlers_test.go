@@ -2563,6 +2563,49 @@ func TestDiagnose_ConfigSync_WithMockDocker(t *testing.T) {
 	}
 }
 
+func TestMcpResponsePayload(t *testing.T) {
+	tests := []struct {
+		name        string
+		contentType string
+		body        string
+		expected    string
+	}{
+		{
+			name:        "plain JSON passes through",
+			contentType: "application/json",
+			body:        `{"jsonrpc":"2.0","id":1,"result":{}}`,
+			expected:    `{"jsonrpc":"2.0","id":1,"result":{}}`,
+		},
+		{
+			name:        "SSE data line extracted",
+			contentType: "text/event-stream",
+			body:        "event: message\r\ndata: {\"jsonrpc\":\"2.0\",\"id\":1}\r\n\r\n",
+			expected:    `{"jsonrpc":"2.0","id":1}`,
+		},
+		{
+			name:        "SSE content type with parameters",
+			contentType: "Text/Event-Stream; charset=utf-8",
+			body:        "data: {\"id\":2}\n\ndata: {\"id\":3}\n\n",
+			expected:    `{"id":2}`,
+		},
+		{
+			name:        "SSE without data falls back to body",
+			contentType: "text/event-stream",
+			body:        ": keep-alive\n\n",
+			expected:    ": keep-alive\n\n",
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			got := string(mcpResponsePayload(tt.contentType, []byte(tt.body)))
+			if got != tt.expected {
+				t.Errorf("mcpResponsePayload() = %q, want %q", got, tt.expected)
+			}
+		})
+	}
+}
+
 // ==================== Payload Size Verification ====================
 
 func TestToolDefinitions_CountAndSize(t *testing.T) {
@@ -13,6 +13,13 @@ const { execSync } = require('child_process');
 // Paths
 const MCPM_DIR = path.dirname(__dirname);
 const REGISTRY_CONFIG_PATH = path.join(MCPM_DIR, 'config', 'technologies.toml');
+const PACKAGE_JSON_PATH = path.join(MCPM_DIR, 'package.json');
+
+// Parsed registry, reused until technologies.toml changes on disk
+let registryCache = null;
+
+// Parsed package.json dependencies, reused until package.json changes on disk
+let dependenciesCache = null;
 
 /**
  * Get user config directory path
@@ -48,14 +55,22 @@ function getClientsConfigPath() {
 
 /**
  * Read registry config (TOML format)
+ * The parsed result is cached and only re-parsed when the file's mtime or
+ * size changes, so callers must treat it as read-only.
  * @returns {Object} Registry configuration
  */
 function readRegistryConfig() {
     if (!fs.existsSync(REGISTRY_CONFIG_PATH)) {
         throw new Error(`Registry config not found at ${REGISTRY_CONFIG_PATH}`);
     }
+    const stat = fs.statSync(REGISTRY_CONFIG_PATH);
+    if (registryCache && registryCache.mtimeMs === stat.mtimeMs && registryCache.size === stat.size) {
+        return registryCache.config;
+    }
     const content = fs.readFileSync(REGISTRY_CONFIG_PATH, 'utf-8');
-    return toml.parse(content);
+    const config = toml.parse(content);
+    registryCache = { mtimeMs: stat.mtimeMs, size: stat.size, config };
+    return config;
 }
 
 /**
@@ -174,6 +189,32 @@ function findServer(name) {
     return null;
 }
 
+/**
+ * Get dependencies declared in MCPM's package.json
+ * Cached like the registry, so installs that rewrite package.json
+ * (npm install --save) are picked up without a restart.
+ * @returns {Object} Map of package name to version (empty object if unreadable)
+ */
+function readInstalledPackages() {
+    let stat;
+    try {
+        stat = fs.statSync(PACKAGE_JSON_PATH);
+    } catch {
+        return {};
+    }
+    if (dependenciesCache && dependenciesCache.mtimeMs === stat.mtimeMs && dependenciesCache.size === stat.size) {
+        return dependenciesCache.dependencies;
+    }
+    let dependencies = {};
+    try {
+        dependencies = JSON.parse(fs.readFileSync(PACKAGE_JSON_PATH, 'utf-8')).dependencies || {};
+    } catch (e) {
+        console.error(`Failed to parse ${PACKAGE_JSON_PATH}:`, e.message);
+    }
+    dependenciesCache = { mtimeMs: stat.mtimeMs, size: stat.size, dependencies };
+    return dependencies;
+}
+
 /**
  * Check if Docker is available
  * @returns {boolean} True if Docker is detected
@@ -357,6 +398,7 @@ module.exports = {
     saveClientsConfig,
     getAllServers,
     findServer,
+    readInstalledPackages,
     isDockerAvailable,
     successResponse,
     errorResponse,
@@ -12,12 +12,12 @@
 
 const express = require('express');
 const { execSync } = require('child_process');
-const path = require('path');
 const {
     successResponse,
     errorResponse,
     getAllServers,
     findServer,
+    readInstalledPackages,
     readUserConfig,
     saveUserConfig,
     MCPM_DIR
@@ -227,15 +227,7 @@ router.delete('/:name', (req, res) => {
         }
 
         // Check if server is installed via npm before trying to uninstall
-        let isInstalled = false;
-        try {
-            const pkgJson = require(path.join(MCPM_DIR, 'package.json'));
-            isInstalled = !!(pkgJson.dependencies && pkgJson.dependencies[name]);
-        } catch (e) {
-            // package.json doesn't exist or is invalid
-        }
-
-        if (!isInstalled) {
+        if (!Object.prototype.hasOwnProperty.call(readInstalledPackages(), name)) {
             return res.status(404).json(errorResponse(
                 'SERVER_NOT_INSTALLED',
                 `Server '${name}' is not installed`
@@ -397,13 +389,8 @@ function isServerInstalled(name, tech, group) {
     }
 
     // Check package.json dependencies
-    try {
-        const pkgJson = require(path.join(MCPM_DIR, 'package.json'));
-        const pkgName = tech.package || name;
-        return !!(pkgJson.dependencies && pkgJson.dependencies[pkgName]);
-    } catch (e) {
-        return false;
-    }
+    const pkgName = tech.package || name;
+    return Object.prototype.hasOwnProperty.call(readInstalledPackages(), pkgName);
 }
 
 /**